@@ -1,10 +1,138 @@
 import os
-import heapq
-import pickle
-from collections import Counter
+import sys
+import struct
+from collections import Counter, deque
+from contextlib import ExitStack
 import unittest
+from unittest import mock
 import time
 
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+_HUFFTREE_HEADER = struct.Struct('<BI')
+_CHUNK_SIZE = 1 << 20
+_BITS = tuple(format(byte, '08b') for byte in range(256))
+
+
+def _encode_kernel(data, code_bits, code_len, max_length, buffer, free_bits):
+    out = np.empty((64 - free_bits + data.size * max_length) // 8, dtype=np.uint8)
+
+    pos = 0
+    for i in range(data.size):
+        symbol = data[i]
+        free_bits -= code_len[symbol]
+        buffer |= code_bits[symbol] << np.uint64(free_bits)
+        while free_bits <= 56:
+            out[pos] = np.uint8(buffer >> np.uint64(56))
+            pos += 1
+            buffer <<= np.uint64(8)
+            free_bits += 8
+    return out[:pos], buffer, free_bits
+
+
+def _decode_kernel(data, total_bits, table_symbol, table_length, root_width):
+    out = np.empty(max(16, data.size * 2), dtype=np.uint8)
+    count = 0
+    buffer = 0
+    buffered_bits = 0
+    pos = 0
+    consumed = 0
+    while consumed < total_bits:
+        base = 0
+        width = root_width
+        while True:
+            while buffered_bits < width:
+                buffer = (buffer << 8) | (int(data[pos]) if pos < data.size else 0)
+                buffered_bits += 8
+                pos += 1
+            index = (buffer >> (buffered_bits - width)) & ((1 << width) - 1)
+            length = table_length[base + index]
+            if length == 0:
+                raise ValueError("Datos comprimidos inválidos: código inexistente")
+            if length > 0:
+                break
+            buffered_bits -= width
+            consumed += width
+            base = table_symbol[base + index]
+            width = -length
+
+        if count == out.size:
+            grown = np.empty(out.size * 2, dtype=np.uint8)
+            grown[:count] = out
+            out = grown
+        out[count] = table_symbol[base + index]
+        count += 1
+        buffered_bits -= length
+        consumed += length
+        if consumed > total_bits:
+            raise ValueError("Datos comprimidos inválidos: código incompleto")
+        buffer &= (1 << buffered_bits) - 1
+    return out[:count]
+
+
+def _has_unknown_symbol(data, code_len):
+    for i in range(data.size):
+        if code_len[data[i]] == 0:
+            return True
+    return False
+
+
+if njit is not None:
+    _has_unknown_symbol = njit(cache=True)(_has_unknown_symbol)
+    _encode_kernel = njit(cache=True)(_encode_kernel)
+    _decode_kernel = njit(cache=True)(_decode_kernel)
+
+
+def _encode_bytes(data, code_bits, code_len, output):
+    buffer = 0
+    buffered_bits = 0
+    for symbol in data:
+        length = code_len[symbol]
+        buffer = (buffer << length) | code_bits[symbol]
+        buffered_bits += length
+        while buffered_bits >= 64:
+            buffered_bits -= 64
+            output.write((buffer >> buffered_bits).to_bytes(8, 'big'))
+            buffer &= (1 << buffered_bits) - 1
+
+    padding = -buffered_bits % 8
+    if buffered_bits:
+        output.write((buffer << padding).to_bytes((buffered_bits + padding) // 8, 'big'))
+    return padding
+
+
+def _decode_bits(byte_data, left, right, symbols, padding):
+    if np is not None:
+        bits = np.unpackbits(np.frombuffer(byte_data, dtype=np.uint8))
+        bits = (bits + ord('0')).tobytes().decode('ascii')
+    else:
+        bits = ''.join([_BITS[byte] for byte in byte_data])
+
+    bits = bits[:-padding] if padding else bits
+
+    decoded_data = bytearray()
+    node = 0
+    for bit in bits:
+        node = left[node] if bit == '0' else right[node]
+        if node < 0:
+            raise ValueError("Datos comprimidos inválidos: código inexistente")
+        symbol = symbols[node]
+        if symbol >= 0:
+            decoded_data.append(symbol)
+            node = 0
+
+    if node != 0:
+        raise ValueError("Datos comprimidos inválidos: código incompleto")
+    return bytes(decoded_data)
+
 class HuffmanNode:
     def __init__(self, char=None, freq=0):
         self.char = char        
@@ -12,9 +140,6 @@ class HuffmanNode:
         self.left = None        
         self.right = None       
         
-    def __lt__(self, other):
-        return self.freq < other.freq
-    
     def is_leaf(self):
         return self.char is not None
         
@@ -23,10 +148,16 @@ class HuffmanCompressor:
         self.frequency_map = {}      
         self.huffman_tree = None     
         self.codes = {}              
+        self.codes_int = {}          
+        self.code_lengths = {}       
         
     def calculate_frequencies(self, text):
 
-        self.frequency_map = Counter(text)
+        if np is not None and isinstance(text, (bytes, bytearray)):
+            counts = np.bincount(np.frombuffer(text, dtype=np.uint8), minlength=256)
+            self.frequency_map = {int(symbol): int(count) for symbol, count in enumerate(counts) if count}
+        else:
+            self.frequency_map = Counter(text)
         return self.frequency_map
     
     def build_huffman_tree(self):
@@ -34,41 +165,98 @@ class HuffmanCompressor:
         if not self.frequency_map:
             raise ValueError("No hay frecuencias calculadas. Ejecute calculate_frequencies primero.")
 
-        priority_queue = [HuffmanNode(char, freq) for char, freq in self.frequency_map.items()]
-        heapq.heapify(priority_queue)
-
-        while len(priority_queue) > 1:
-            left = heapq.heappop(priority_queue)
-            right = heapq.heappop(priority_queue)
-
-            internal_node = HuffmanNode(freq=left.freq + right.freq)
-            internal_node.left = left
-            internal_node.right = right
-            
-            heapq.heappush(priority_queue, internal_node)
-
-        self.huffman_tree = priority_queue[0] if priority_queue else None
+        symbols = sorted(self.frequency_map, key=lambda char: (self.frequency_map[char], char))
+        freqs = [self.frequency_map[char] for char in symbols]
+        left = [-1] * len(symbols)
+        right = [-1] * len(symbols)
+
+        leaf_count = len(symbols)
+        next_leaf = 0
+        next_internal = leaf_count
+        while (leaf_count - next_leaf) + (len(freqs) - next_internal) > 1:
+            children = []
+            for _ in range(2):
+                if next_leaf < leaf_count and (next_internal == len(freqs) or freqs[next_leaf] <= freqs[next_internal]):
+                    children.append(next_leaf)
+                    next_leaf += 1
+                else:
+                    children.append(next_internal)
+                    next_internal += 1
+
+            freqs.append(freqs[children[0]] + freqs[children[1]])
+            left.append(children[0])
+            right.append(children[1])
+
+        nodes = [HuffmanNode(char, freq) for char, freq in zip(symbols, freqs)]
+        for index in range(len(symbols), len(freqs)):
+            internal_node = HuffmanNode(freq=freqs[index])
+            internal_node.left = nodes[left[index]]
+            internal_node.right = nodes[right[index]]
+            nodes.append(internal_node)
+
+        self.huffman_tree = nodes[-1]
         return self.huffman_tree
     
-    def generate_codes(self, node=None, code=""):
+    def generate_codes(self):
 
-        if node is None:
-            if self.huffman_tree is None:
-                raise ValueError("No hay árbol de Huffman. Ejecute build_huffman_tree primero.")
-            node = self.huffman_tree
-            self.codes = {}
+        if self.huffman_tree is None:
+            raise ValueError("No hay árbol de Huffman. Ejecute build_huffman_tree primero.")
         
-        if node.is_leaf():
-            self.codes[node.char] = code if code else "0" 
-            return
-        
-        if node.left:
-            self.generate_codes(node.left, code + "0")
-        if node.right:
-            self.generate_codes(node.right, code + "1")
+        code_lengths = {}
+        stack = [(self.huffman_tree, 0)]
+        while stack:
+            node, depth = stack.pop()
+            if node.is_leaf():
+                code_lengths[node.char] = depth or 1
+                continue
             
+            if node.right:
+                stack.append((node.right, depth + 1))
+            if node.left:
+                stack.append((node.left, depth + 1))
+
+        self.assign_canonical_codes(code_lengths)
+        self.huffman_tree = self.build_tree_from_codes()
+        return self.codes
+    
+    def assign_canonical_codes(self, code_lengths):
+
+        self.code_lengths = dict(code_lengths)
+        self.codes = {}
+        self.codes_int = {}
+
+        code = 0
+        previous_length = 0
+        for char, length in sorted(self.code_lengths.items(), key=lambda item: (item[1], item[0])):
+            code <<= length - previous_length
+            self.codes_int[char] = (code, length)
+            self.codes[char] = format(code, f"0{length}b")
+            code += 1
+            previous_length = length
+
         return self.codes
     
+    def build_tree_from_codes(self):
+
+        root = HuffmanNode()
+        for char, (code, length) in self.codes_int.items():
+            freq = self.frequency_map.get(char, 0)
+            node = root
+            node.freq += freq
+            for shift in range(length - 1, -1, -1):
+                if (code >> shift) & 1:
+                    if node.right is None:
+                        node.right = HuffmanNode()
+                    node = node.right
+                else:
+                    if node.left is None:
+                        node.left = HuffmanNode()
+                    node = node.left
+                node.freq += freq
+            node.char = char
+
+        return root
+    
     def serialize_tree(self, node=None):
 
         if node is None:
@@ -76,107 +264,295 @@ class HuffmanCompressor:
                 raise ValueError("No hay árbol de Huffman. Ejecute build_huffman_tree primero.")
             node = self.huffman_tree
         
-        serialized = []
-        if node.is_leaf():
-            serialized.append(True)
-            serialized.append(node.char)
-        else:
-            serialized.append(False)
-            if node.left:
-                serialized.extend(self.serialize_tree(node.left))
-            if node.right:
-                serialized.extend(self.serialize_tree(node.right))
+        serialized = bytearray()
+        stack = [node]
+        while stack:
+            node = stack.pop()
+            if node.is_leaf():
+                if not isinstance(node.char, int) or not 0 <= node.char < 256:
+                    raise ValueError(f"serialize_tree solo admite símbolos de un byte (0-255), no {node.char!r}")
+                serialized.append(1)
+                serialized.append(node.char)
+            else:
+                serialized.append(0)
+                if node.right:
+                    stack.append(node.right)
+                if node.left:
+                    stack.append(node.left)
                 
-        return serialized
+        return bytes(serialized)
     
     def deserialize_tree(self, serialized):
 
         if not serialized:
-            return None, []
+            return None, b''
         
-        is_leaf = serialized[0]
-        
-        if is_leaf:
-            char = serialized[1]
-            node = HuffmanNode(char, 0)
-            return node, serialized[2:]
-        else:
-            node = HuffmanNode()
-            left_node, remaining = self.deserialize_tree(serialized[1:])
-            node.left = left_node
-            right_node, remaining = self.deserialize_tree(remaining)
-            node.right = right_node
+        root = None
+        pending = []
+        position = 0
+        while position < len(serialized):
+            is_leaf = serialized[position]
+            if is_leaf:
+                node = HuffmanNode(serialized[position + 1], 0)
+                position += 2
+            else:
+                node = HuffmanNode()
+                position += 1
+
+            if pending:
+                parent = pending[-1]
+                if parent.left is None:
+                    parent.left = node
+                else:
+                    parent.right = node
+                    pending.pop()
+            else:
+                root = node
+
+            if not is_leaf:
+                pending.append(node)
+            if not pending:
+                break
             
-            return node, remaining
+        return root, serialized[position:]
+    
+    def flatten_tree(self):
+
+        if self.huffman_tree is None:
+            raise ValueError("No hay árbol de Huffman. Ejecute build_huffman_tree primero.")
+
+        left, right, symbols = [], [], []
+        queue = deque([self.huffman_tree])
+        while queue:
+            node = queue.popleft()
+            next_index = len(symbols) + len(queue) + 1
+            symbols.append(node.char if node.is_leaf() else -1)
+            left.append(-1)
+            right.append(-1)
+            if node.left:
+                left[-1] = next_index
+                queue.append(node.left)
+                next_index += 1
+            if node.right:
+                right[-1] = next_index
+                queue.append(node.right)
+
+        return left, right, symbols
+    
+    def build_decode_table(self, root_bits=9):
+
+        table_symbol, table_length = [], []
+        entries = [(code, length, symbol) for symbol, (code, length) in self.codes_int.items()]
+        pending = [(-1, entries, 0)]
+        while pending:
+            link, entries, consumed = pending.pop()
+            width = min(root_bits, max(length for _, length, _ in entries) - consumed)
+            base = len(table_symbol)
+            table_symbol.extend([0] * (1 << width))
+            table_length.extend([0] * (1 << width))
+            if link >= 0:
+                table_symbol[link] = base
+                table_length[link] = -width
+
+            long_codes = {}
+            for code, length, symbol in entries:
+                remaining = length - consumed
+                suffix = code & ((1 << remaining) - 1)
+                if remaining <= width:
+                    start = suffix << (width - remaining)
+                    for index in range(base + start, base + start + (1 << (width - remaining))):
+                        table_symbol[index] = symbol
+                        table_length[index] = remaining
+                else:
+                    long_codes.setdefault(suffix >> (remaining - width), []).append((code, length, symbol))
+            for prefix, group in long_codes.items():
+                pending.append((base + prefix, group, consumed + width))
+
+        root_width = min(root_bits, max(length for _, length in self.codes_int.values()))
+        return np.array(table_symbol, dtype=np.int32), np.array(table_length, dtype=np.int32), root_width
+    
+    def code_tables(self):
+
+        if np is None:
+            code_bits = [0] * 256
+            code_len = [0] * 256
+        else:
+            fits_uint64 = max(length for _, length in self.codes_int.values()) <= 64
+            code_bits = np.zeros(256, dtype=np.uint64 if fits_uint64 else object)
+            code_len = np.zeros(256, dtype=np.uint8)
+        for symbol, (code, length) in self.codes_int.items():
+            code_bits[symbol] = code
+            code_len[symbol] = length
+        return code_bits, code_len
+    
+    def encode_bytes(self, data, output):
+
+        max_length = max(length for _, length in self.codes_int.values())
+        if njit is not None and max_length <= 57:
+            code_bits, code_len = self.code_tables()
+            symbols = np.frombuffer(data, dtype=np.uint8)
+            buffer = 0
+            free_bits = 64
+            for start in range(0, len(symbols), _CHUNK_SIZE):
+                chunk, buffer, free_bits = _encode_kernel(symbols[start:start + _CHUNK_SIZE],
+                                                          code_bits, code_len, max_length,
+                                                          np.uint64(buffer), free_bits)
+                output.write(chunk.tobytes())
+            buffered_bits = 64 - free_bits
+            output.write(int(buffer).to_bytes(8, 'big')[:(buffered_bits + 7) // 8])
+            return -buffered_bits % 8
+
+        if np is not None:
+            carry = np.empty(0, dtype=np.uint8)
+            for start in range(0, len(data), _CHUNK_SIZE):
+                encoded_text = data[start:start + _CHUNK_SIZE].decode('latin-1').translate(self.codes)
+                bits = np.frombuffer(encoded_text.encode('ascii'), dtype=np.uint8) - ord('0')
+                bits = np.concatenate((carry, bits))
+                whole_bits = len(bits) - len(bits) % 8
+                output.write(np.packbits(bits[:whole_bits]).tobytes())
+                carry = bits[whole_bits:]
+            output.write(np.packbits(carry).tobytes())
+            return -len(carry) & 7
+
+        code_bits, code_len = self.code_tables()
+        return _encode_bytes(data, code_bits, code_len, output)
+    
+    def write_code_length_table(self, path, padding=0):
+
+        code_length_table = sorted(self.code_lengths.items(), key=lambda item: (item[1], item[0]))
+        with open(path, 'wb') as file:
+            file.write(_HUFFTREE_HEADER.pack(padding, len(code_length_table)))
+            file.write(bytes(value for pair in code_length_table for value in pair))
+
+    def read_code_length_table(self, path):
+
+        with open(path, 'rb') as file:
+            header = file.read(_HUFFTREE_HEADER.size)
+            padding, table_size = _HUFFTREE_HEADER.unpack(header)
+            code_length_table = file.read(2 * table_size)
+        if len(code_length_table) != 2 * table_size:
+            raise ValueError("tabla de longitudes incompleta")
+        if padding > 7:
+            raise ValueError("relleno inválido en la tabla de longitudes")
+
+        symbols = code_length_table[0::2]
+        lengths = code_length_table[1::2]
+        if not symbols:
+            raise ValueError("tabla de longitudes vacía")
+        if len(set(symbols)) != len(symbols):
+            raise ValueError("tabla de longitudes con símbolos duplicados")
+        if 0 in lengths:
+            raise ValueError("tabla de longitudes con longitud cero")
+        max_length = max(lengths)
+        kraft_sum = sum(1 << (max_length - length) for length in lengths)
+        if kraft_sum != 1 << max_length and lengths != b'\x01':
+            raise ValueError("las longitudes no forman un código de Huffman completo")
+
+        self.assign_canonical_codes(dict(zip(symbols, lengths)))
+        self.huffman_tree = self.build_tree_from_codes()
+        return padding
+    
+    def save_static_table(self, path):
+
+        if not self.code_lengths:
+            raise ValueError("No hay códigos generados. Ejecute generate_codes primero.")
+        try:
+            self.write_code_length_table(path)
+        except Exception as e:
+            raise IOError(f"Error al escribir la tabla estática: {e}")
+    
+    def load_static_table(self, path):
+
+        try:
+            self.read_code_length_table(path)
+        except ValueError:
+            raise
+        except Exception as e:
+            raise IOError(f"Error al leer la tabla estática: {e}")
+        return self.codes
     
     def compress(self, input_file, output_file_prefix):
         try:
-            with open(input_file, 'r', encoding='utf-8') as file:
-                text = file.read()
+            with open(input_file, 'rb') as file:
+                data = file.read()
         except Exception as e:
             raise IOError(f"Error al leer el archivo: {e}")
 
-        self.calculate_frequencies(text)
+        self.calculate_frequencies(data)
         self.build_huffman_tree()
         self.generate_codes()
         
-        encoded_text = ""
-        for char in text:
-            encoded_text += self.codes[char]
-        padding = 8 - (len(encoded_text) % 8) if (len(encoded_text) % 8) != 0 else 0
-        padded_text = encoded_text + '0' * padding
-
-        bytes_array = bytearray()
-        for i in range(0, len(padded_text), 8):
-            byte = padded_text[i:i+8]
-            bytes_array.append(int(byte, 2))
+        return self.write_compressed(data, input_file, output_file_prefix)
+    
+    def compress_with_static(self, input_file, output_file_prefix):
+        if not self.codes_int:
+            raise ValueError("No hay tabla estática. Ejecute load_static_table primero.")
+
+        try:
+            with open(input_file, 'rb') as file:
+                data = file.read()
+        except Exception as e:
+            raise IOError(f"Error al leer el archivo: {e}")
+
+        if np is not None:
+            _, code_len = self.code_tables()
+            symbols = np.frombuffer(data, dtype=np.uint8)
+            if njit is not None:
+                has_missing = _has_unknown_symbol(symbols, code_len)
+            else:
+                has_missing = not code_len[symbols].all()
+        else:
+            has_missing = not set(data).issubset(self.codes_int)
+        if has_missing:
+            missing = set(data).difference(self.codes_int)
+            raise ValueError(f"La tabla estática no contiene los símbolos: {sorted(missing)}")
         
-        serialized_tree = self.serialize_tree()
+        return self.write_compressed(data, input_file, output_file_prefix)
+    
+    def write_compressed(self, data, input_file, output_file_prefix):
         try:
-            with open(f"{output_file_prefix}.hufftree", 'wb') as file:
-                pickle.dump((serialized_tree, padding), file)
-            with open(f"{output_file_prefix}.huff", 'wb') as file:
-                file.write(bytes_array)
+            with open(f"{output_file_prefix}.huff", 'wb', buffering=_CHUNK_SIZE) as file:
+                padding = self.encode_bytes(data, file)
+            self.write_code_length_table(f"{output_file_prefix}.hufftree", padding)
                 
             return os.path.getsize(input_file), os.path.getsize(f"{output_file_prefix}.huff")
         except Exception as e:
             raise IOError(f"Error al escribir los archivos: {e}")
     
+    def decode_bytes(self, byte_data, padding):
+
+        if njit is not None and self.codes_int:
+            table_symbol, table_length, root_width = self.build_decode_table()
+            decoded = _decode_kernel(np.frombuffer(byte_data, dtype=np.uint8),
+                                     len(byte_data) * 8 - padding, table_symbol, table_length, root_width)
+            return decoded.tobytes()
+
+        left, right, symbols = self.flatten_tree()
+        return _decode_bits(byte_data, left, right, symbols, padding)
+    
     def decompress(self, huff_file, hufftree_file, output_file=None):
         try:
-            with open(hufftree_file, 'rb') as file:
-                serialized_tree, padding = pickle.load(file)
-
-            self.huffman_tree, _ = self.deserialize_tree(serialized_tree)
+            padding = self.read_code_length_table(hufftree_file)
             
             with open(huff_file, 'rb') as file:
                 byte_data = file.read()
+            if padding and padding >= len(byte_data) * 8:
+                raise ValueError("relleno mayor que los datos comprimidos")
+        except ValueError:
+            raise
         except Exception as e:
             raise IOError(f"Error al leer los archivos: {e}")
 
-        bits = ""
-        for byte in byte_data:
-            bits += bin(byte)[2:].zfill(8)
-
-        bits = bits[:-padding] if padding else bits
- 
-        decoded_text = ""
-        current_node = self.huffman_tree
-        for bit in bits:
-            current_node = current_node.left if bit == '0' else current_node.right
-            
-            if current_node.is_leaf():
-                decoded_text += current_node.char
-                current_node = self.huffman_tree
+        decoded_data = self.decode_bytes(byte_data, padding)
 
         if output_file:
             try:
-                with open(output_file, 'w', encoding='utf-8') as file:
-                    file.write(decoded_text)
+                with open(output_file, 'wb') as file:
+                    file.write(decoded_data)
             except Exception as e:
                 raise IOError(f"Error al escribir el archivo descomprimido: {e}")
                 
-        return decoded_text
+        return decoded_data
 
 
 class HuffmanTests(unittest.TestCase):
@@ -189,7 +565,8 @@ class HuffmanTests(unittest.TestCase):
     
     def tearDown(self):
         """Limpieza después de las pruebas."""
-        files_to_remove = ['test_file.txt', 'test_file.huff', 'test_file.hufftree', 'test_file_decompressed.txt']
+        files_to_remove = ['test_file.txt', 'test_file.huff', 'test_file.hufftree', 'test_file_decompressed.txt',
+                           'test_file.table']
         for file in files_to_remove:
             if os.path.exists(file):
                 try:
@@ -197,6 +574,34 @@ class HuffmanTests(unittest.TestCase):
                 except:
                     pass
     
+    def available_backends(self):
+        """Devuelve los módulos a desactivar para probar cada implementación."""
+        backends = [('python', ['njit', 'np'])]
+        if np is not None:
+            backends.insert(0, ('numpy', ['njit']))
+        if njit is not None:
+            backends.insert(0, ('numba', []))
+        return backends
+    
+    def disable_modules(self, disabled):
+        """Sustituye por None los módulos indicados mientras dure el bloque with."""
+        stack = ExitStack()
+        for name in disabled:
+            stack.enter_context(mock.patch.object(sys.modules[__name__], name, None))
+        return stack
+    
+    def compress_cycle(self, data, disabled):
+        """Comprime y descomprime los datos con los módulos indicados desactivados."""
+        with open('test_file.txt', 'wb') as file:
+            file.write(data)
+
+        with self.disable_modules(disabled):
+            HuffmanCompressor().compress('test_file.txt', 'test_file')
+            decompressed_data = HuffmanCompressor().decompress('test_file.huff', 'test_file.hufftree')
+
+        with open('test_file.huff', 'rb') as file:
+            return decompressed_data, file.read()
+    
     def test_frequency_calculation(self):
         """Prueba el cálculo de frecuencias."""
         frequencies = self.compressor.calculate_frequencies(self.test_text)
@@ -229,6 +634,34 @@ class HuffmanTests(unittest.TestCase):
         least_frequent = freq_list[-1][0]
         self.assertLessEqual(len(codes[most_frequent]), len(codes[least_frequent]))
     
+    def test_tree_serialization(self):
+        """Prueba que el árbol serializado se reconstruye igual."""
+        self.compressor.calculate_frequencies(self.test_text.encode('utf-8'))
+        self.compressor.build_huffman_tree()
+        serialized = self.compressor.serialize_tree()
+
+        tree, remaining = self.compressor.deserialize_tree(serialized)
+
+        self.assertEqual(remaining, b'')
+        self.assertEqual(self.compressor.serialize_tree(tree), serialized)
+
+        self.compressor.calculate_frequencies(self.test_text)
+        self.compressor.build_huffman_tree()
+        with self.assertRaises(ValueError):
+            self.compressor.serialize_tree()
+    
+    def test_canonical_codes(self):
+        """Prueba que los códigos canónicos se reconstruyen desde las longitudes."""
+        self.compressor.calculate_frequencies(self.test_text)
+        self.compressor.build_huffman_tree()
+        codes = self.compressor.generate_codes()
+
+        rebuilt = HuffmanCompressor().assign_canonical_codes(self.compressor.code_lengths)
+        self.assertEqual(rebuilt, codes)
+
+        for char, code in codes.items():
+            self.assertEqual(len(code), self.compressor.code_lengths[char])
+    
     def test_compression_decompression_cycle(self):
         """Prueba el ciclo completo de compresión y descompresión."""
 
@@ -239,7 +672,7 @@ class HuffmanTests(unittest.TestCase):
 
         decompressed_text = self.compressor.decompress('test_file.huff', 'test_file.hufftree', 'test_file_decompressed.txt')
 
-        self.assertEqual(decompressed_text, self.test_text)
+        self.assertEqual(decompressed_text, self.test_text.encode('utf-8'))
 
         self.assertTrue(os.path.exists('test_file_decompressed.txt'))
 
@@ -251,6 +684,129 @@ class HuffmanTests(unittest.TestCase):
         if len(self.test_text) > 10:
             self.assertLess(compressed_size, original_size)
 
+    def test_binary_cycle(self):
+        """Prueba que la compresión trabaja sobre bytes arbitrarios."""
+        data = bytes(range(256)) * 3 + b'\x00' * 100
+        with open('test_file.txt', 'wb') as file:
+            file.write(data)
+
+        self.compressor.compress('test_file.txt', 'test_file')
+        decompressed_data = HuffmanCompressor().decompress('test_file.huff', 'test_file.hufftree')
+
+        self.assertEqual(decompressed_data, data)
+
+    def test_long_codes_cycle(self):
+        """Prueba códigos más largos que la tabla raíz del decodificador."""
+        fib = [1, 1]
+        while len(fib) < 30:
+            fib.append(fib[-1] + fib[-2])
+        data = b''.join(bytes([i]) * fib[i] for i in range(30))
+        with open('test_file.txt', 'wb') as file:
+            file.write(data)
+
+        self.compressor.compress('test_file.txt', 'test_file')
+        self.assertGreater(max(self.compressor.code_lengths.values()), 2 * 9)
+        decompressed_data = HuffmanCompressor().decompress('test_file.huff', 'test_file.hufftree')
+
+        self.assertEqual(decompressed_data, data)
+
+    def test_invalid_code_rejected(self):
+        """Prueba que un código inexistente produce un error en cada implementación."""
+        self.compressor.assign_canonical_codes({65: 1})
+        self.compressor.huffman_tree = self.compressor.build_tree_from_codes()
+
+        for backend, disabled in self.available_backends():
+            with self.subTest(backend=backend), self.disable_modules(disabled):
+                with self.assertRaisesRegex(ValueError, "código inexistente"):
+                    self.compressor.decode_bytes(b'\xff', 0)
+
+    def test_truncated_code_rejected(self):
+        """Prueba que un código cortado por el relleno produce un error en cada implementación."""
+        self.compressor.assign_canonical_codes({65: 1, 66: 2, 67: 2})
+        self.compressor.huffman_tree = self.compressor.build_tree_from_codes()
+
+        for backend, disabled in self.available_backends():
+            with self.subTest(backend=backend), self.disable_modules(disabled):
+                self.assertEqual(self.compressor.decode_bytes(b'\x80', 6), b'B')
+                with self.assertRaisesRegex(ValueError, "código incompleto"):
+                    self.compressor.decode_bytes(b'\x80', 7)
+
+    def test_invalid_code_length_table(self):
+        """Prueba que se rechazan tablas de longitudes mal formadas."""
+        self.compressor.compress('test_file.txt', 'test_file')
+        invalid_tables = [
+            [(65, 2), (66, 2)],
+            [(65, 1), (65, 1)],
+            [(65, 0), (66, 1)],
+            [(65, 1), (66, 1), (67, 1)],
+            [],
+        ]
+        for table in invalid_tables:
+            with open('test_file.hufftree', 'wb') as file:
+                file.write(_HUFFTREE_HEADER.pack(0, len(table)))
+                file.write(bytes(value for pair in table for value in pair))
+            with self.assertRaises(ValueError):
+                HuffmanCompressor().decompress('test_file.huff', 'test_file.hufftree')
+
+    def test_invalid_padding(self):
+        """Prueba que se rechaza un relleno imposible."""
+        self.compressor.compress('test_file.txt', 'test_file')
+        for padding in (8, 200):
+            self.compressor.write_code_length_table('test_file.hufftree', padding)
+            with self.assertRaisesRegex(ValueError, "relleno"):
+                HuffmanCompressor().decompress('test_file.huff', 'test_file.hufftree')
+
+        self.compressor.write_code_length_table('test_file.hufftree', 1)
+        with open('test_file.huff', 'wb'):
+            pass
+        with self.assertRaisesRegex(ValueError, "relleno"):
+            HuffmanCompressor().decompress('test_file.huff', 'test_file.hufftree')
+
+    def test_backends_cycle(self):
+        """Prueba cada implementación y que todas escriben el mismo .huff."""
+        data = self.test_text.encode('utf-8') * 20 + bytes(range(256))
+        encoded = {}
+        for backend, disabled in self.available_backends():
+            with self.subTest(backend=backend):
+                decompressed_data, encoded[backend] = self.compress_cycle(data, disabled)
+                self.assertEqual(decompressed_data, data)
+
+        self.assertEqual(len(set(encoded.values())), 1)
+
+    def test_chunk_boundaries_cycle(self):
+        """Prueba la codificación por bloques con un tamaño de bloque pequeño."""
+        data = self.test_text.encode('utf-8') * 5 + bytes(range(256))
+        with mock.patch.object(sys.modules[__name__], '_CHUNK_SIZE', 7):
+            encoded = {}
+            for backend, disabled in self.available_backends():
+                with self.subTest(backend=backend):
+                    decompressed_data, encoded[backend] = self.compress_cycle(data, disabled)
+                    self.assertEqual(decompressed_data, data)
+
+        self.assertEqual(len(set(encoded.values())), 1)
+
+    def test_static_table_cycle(self):
+        """Prueba la compresión reutilizando una tabla estática guardada."""
+        self.compressor.compress('test_file.txt', 'test_file')
+        self.compressor.save_static_table('test_file.table')
+
+        other_text = "texto de prueba para la tabla"
+        with open('test_file.txt', 'w', encoding='utf-8') as file:
+            file.write(other_text)
+
+        static_compressor = HuffmanCompressor()
+        codes = static_compressor.load_static_table('test_file.table')
+        self.assertEqual(codes, self.compressor.codes)
+
+        static_compressor.compress_with_static('test_file.txt', 'test_file')
+        decompressed_data = HuffmanCompressor().decompress('test_file.huff', 'test_file.hufftree')
+        self.assertEqual(decompressed_data, other_text.encode('utf-8'))
+
+        with open('test_file.txt', 'w', encoding='utf-8') as file:
+            file.write("xyz")
+        with self.assertRaises(ValueError):
+            static_compressor.compress_with_static('test_file.txt', 'test_file')
+
 
 def main():
     compressor = HuffmanCompressor()
@@ -303,7 +859,7 @@ def main():
                 
                 preview_length = min(100, len(decompressed_text))
                 print(f"\nVista previa del texto descomprimido:")
-                print(f"{decompressed_text[:preview_length]}...")
+                print(f"{decompressed_text[:preview_length].decode('utf-8', errors='replace')}...")
             except Exception as e:
                 print(f"Error: {e}")
                 